@@ -1,16 +1,133 @@
 import argparse
+import asyncio
+import hashlib
 import os
 import re
+import sqlite3
+import threading
 import time
 import logging
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlparse
+import dns.asyncresolver
 import dns.resolver
 
 import gspread
+import orjson
 import requests
 from dotenv import load_dotenv
+from email_validator import EmailNotValidError
+from email_validator import validate_email as validate_email_syntax
 from google.oauth2.service_account import Credentials
+from gspread.utils import absolute_range_name, rowcol_to_a1
 from pydantic import BaseModel, Field
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Contact patterns used by WebsiteScraperService; each has one named group
+# holding the value to keep
+_EMAIL_RE = re.compile(r"\b(?P<email>[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,})\b")
+_SOCIAL_URL_PREFIX = r"(?:https?://(?:www\.)?|www\.)?"
+_SOCIAL_PATTERNS = {
+    "instagram": r"instagram\.com/(?P<instagram>[a-zA-Z0-9._]+)",
+    "facebook": r"facebook\.com/(?P<facebook>[a-zA-Z0-9._]+)",
+    "linkedin": r"linkedin\.com/(?:company|in)/(?P<linkedin>[a-zA-Z0-9._-]+)",
+}
+_SOCIAL_KIND_RES = {
+    kind: re.compile(_SOCIAL_URL_PREFIX + pattern)
+    for kind, pattern in _SOCIAL_PATTERNS.items()
+}
+# Single-pass pattern matching every social profile; match.lastgroup names the kind
+_SOCIAL_RE = re.compile(
+    _SOCIAL_URL_PREFIX + "(?:" + "|".join(_SOCIAL_PATTERNS.values()) + ")"
+)
+# Output format and log label for each contact kind
+_CONTACT_FORMATS = {
+    "email": ("{}", "email"),
+    "instagram": ("https://instagram.com/{}", "Instagram"),
+    "facebook": ("https://facebook.com/{}", "Facebook"),
+    "linkedin": ("https://linkedin.com/company/{}", "LinkedIn"),
+}
+
+# Characters stripped from phone numbers before comparing them
+_PHONE_TRANS = str.maketrans("", "", "+ -()\t")
+
+
+def _extract_contacts(content: str) -> dict[str, str | None]:
+    """Return the first email and social profile of each kind found in content."""
+    email = _EMAIL_RE.search(content)
+    result: dict[str, str | None] = {"email": email.group("email") if email else None}
+
+    # Single pass over the page for the social profiles, keeping the start and
+    # value of the first match of each kind plus the span of every match seen
+    found: dict[str, tuple[int, str]] = {}
+    spans: list[tuple[int, int]] = []
+    for match in _SOCIAL_RE.finditer(content):
+        kind = match.lastgroup
+        spans.append(match.span())
+        if kind not in found:
+            found[kind] = (match.start(), match.group(kind))
+            if len(found) == len(_SOCIAL_KIND_RES):
+                break
+
+    # finditer never returns overlapping matches, so a profile starting inside
+    # another kind's match is skipped (e.g. "instagram.com/facebook.com/shop");
+    # retry each kind only inside the spans before its first match
+    for kind, pattern in _SOCIAL_KIND_RES.items():
+        limit = found[kind][0] if kind in found else len(content)
+        hidden = None
+        for start, end in spans:
+            if start >= limit:
+                break
+            for pos in range(start, min(end, limit)):
+                if hidden := pattern.match(content, pos):
+                    break
+            if hidden:
+                found[kind] = (hidden.start(), hidden.group(kind))
+                break
+        result[kind] = found[kind][1] if kind in found else None
+
+    return result
+
+
+def _build_session(pool_size: int = 64) -> requests.Session:
+    """Create a requests session with a shared connection pool and retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        # Retry connection failures only; don't sleep on Retry-After while a
+        # per-host semaphore is held, and hand 429s back to the caller
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.3,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Bound concurrent requests per host so the thread pools don't trigger rate limits
+_MAX_REQUESTS_PER_HOST = 4
+_host_semaphores: defaultdict[str, threading.Semaphore] = defaultdict(
+    lambda: threading.Semaphore(_MAX_REQUESTS_PER_HOST)
+)
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(url: str) -> threading.Semaphore:
+    """Return the semaphore limiting concurrent requests to the URL's host."""
+    host = urlparse(url).netloc.lower()
+    with _host_semaphores_lock:
+        return _host_semaphores[host]
 
 
 class Config(BaseModel):
@@ -21,6 +138,8 @@ class Config(BaseModel):
     location: str = "Manchester, GB"
     max_results: int = 120
     poll_interval: int = 30
+    apify_cache_dir: str | None = None
+    enrich_workers: int = Field(default=32, gt=0)
 
 
 class ApifyScrapeRequest(BaseModel):
@@ -50,55 +169,125 @@ class ScrapedLead(BaseModel):
     place_id: str | None = None
 
 
-class ExistingLead(BaseModel):
-    Business: str | None = Field(default=None, alias="Business")
-    Phone: str | None = Field(default=None, alias="Phone")
-
-    class Config:
-        populate_by_name = True
+@dataclass(slots=True)
+class ExistingLead:
+    # Built once per sheet row, so kept as a plain slotted dataclass
+    Business: str | None = None
+    Phone: str | None = None
 
 
 class ApifyService:
-    def __init__(self, token: str) -> None:
+    # Longest waitForFinish the Apify API accepts, in seconds
+    MAX_WAIT_FOR_FINISH = 60
+    TERMINAL_STATUSES = ("SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT")
+
+    def __init__(self, token: str, cache_dir: str | None = None) -> None:
         self.token = token
+        self.cache_dir = Path(cache_dir) if cache_dir else None
         self.base_url = "https://api.apify.com/v2"
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
         }
+        # Reuse one connection pool for every Apify API call
+        self.session = _build_session()
 
     def start_scrape(self, request: ApifyScrapeRequest) -> str:
         url = f"{self.base_url}/acts/compass~crawler-google-places/runs"
-        response = requests.post(
+        response = self.session.post(
             url,
-            json=request.model_dump(),
+            data=orjson.dumps(request.model_dump()),
             headers=self.headers,
             params={"token": self.token},
             timeout=30,
         )
         response.raise_for_status()
-        job_id = response.json()["data"]["id"]
+        job_id = orjson.loads(response.content)["data"]["id"]
         logging.info(f"Started Apify job with ID: {job_id}")
         return job_id
 
-    def get_job_status(self, job_id: str) -> ApifyJobData:
+    def get_job_status(self, job_id: str, wait_for_finish: int = 0) -> ApifyJobData:
+        """Get a run's status, optionally waiting server-side for it to finish.
+
+        Apify holds the request open for up to ``wait_for_finish`` seconds (max 60)
+        and returns as soon as the run reaches a terminal status.
+        """
         url = f"{self.base_url}/actor-runs/{job_id}"
-        response = requests.get(
-            url, headers=self.headers, params={"token": self.token}, timeout=10
+        params: dict[str, str | int] = {"token": self.token}
+        wait_for_finish = min(wait_for_finish, self.MAX_WAIT_FOR_FINISH)
+        if wait_for_finish > 0:
+            params["waitForFinish"] = wait_for_finish
+        response = self.session.get(
+            url, headers=self.headers, params=params, timeout=10 + wait_for_finish
         )
         response.raise_for_status()
-        data = response.json()["data"]
-        logging.debug(f"Job {job_id} status: {data['status']}")
+        data = orjson.loads(response.content)["data"]
+        logging.debug("Job %s status: %s", job_id, data["status"])
         return ApifyJobData(**data)
 
+    def iter_dataset(self, dataset_id: str) -> Iterator[dict[str, Any]]:
+        """Stream dataset items as JSON lines instead of one large response."""
+        logging.info(f"Streaming dataset {dataset_id}")
+        url = f"{self.base_url}/datasets/{dataset_id}/items"
+        with self.session.get(
+            url,
+            headers=self.headers,
+            params={"token": self.token, "format": "jsonl"},
+            timeout=10,
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if line:
+                    yield orjson.loads(line)
+
     def get_dataset(self, dataset_id: str) -> list[dict[str, Any]]:
         logging.info(f"Fetching dataset {dataset_id}")
-        url = f"{self.base_url}/datasets/{dataset_id}/items"
-        response = requests.get(
-            url, headers=self.headers, params={"token": self.token}, timeout=10
-        )
-        response.raise_for_status()
-        return response.json()
+        return list(self.iter_dataset(dataset_id))
+
+    def _reviews_request(self, place_id: str, max_reviews: int) -> dict[str, Any]:
+        return {
+            "placeIds": [place_id],
+            "maxReviews": max_reviews,
+            "language": "en",
+        }
+
+    def _reviews_cache_path(self, place_id: str, max_reviews: int) -> Path | None:
+        """Return the cache file for a reviews request, or None if caching is off."""
+        if self.cache_dir is None:
+            return None
+        request_data = self._reviews_request(place_id, max_reviews)
+        key = hashlib.sha1(
+            orjson.dumps(request_data, option=orjson.OPT_SORT_KEYS)
+        ).hexdigest()
+        return self.cache_dir / f"reviews-{key}.json"
+
+    def load_cached_reviews(
+        self, place_id: str, max_reviews: int = 10
+    ) -> list[dict[str, Any]] | None:
+        """Load a previously fetched reviews dataset from the disk cache."""
+        cache_path = self._reviews_cache_path(place_id, max_reviews)
+        if cache_path is None or not cache_path.exists():
+            return None
+        logging.info(f"Loading cached reviews dataset from {cache_path}")
+        try:
+            return orjson.loads(cache_path.read_bytes())
+        except orjson.JSONDecodeError as e:
+            logging.warning(f"Discarding corrupt reviews cache {cache_path}: {e}")
+            cache_path.unlink(missing_ok=True)
+            return None
+
+    def save_cached_reviews(
+        self, place_id: str, dataset: list[dict[str, Any]], max_reviews: int = 10
+    ) -> None:
+        """Store a fetched reviews dataset in the disk cache."""
+        cache_path = self._reviews_cache_path(place_id, max_reviews)
+        # Don't cache empty results, so later runs can pick up new reviews
+        if cache_path is None or not dataset:
+            return
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_bytes(orjson.dumps(dataset))
+        logging.info(f"Cached reviews dataset at {cache_path}")
 
     def scrape_reviews(self, place_id: str, max_reviews: int = 10) -> str:
         """Scrape reviews for a given place ID using Apify."""
@@ -106,21 +295,17 @@ class ApifyService:
 
         # Use Google Maps Reviews scraper
         url = f"{self.base_url}/acts/compass~google-maps-reviews-scraper/runs"
-        request_data = {
-            "placeIds": [place_id],
-            "maxReviews": max_reviews,
-            "language": "en",
-        }
+        request_data = self._reviews_request(place_id, max_reviews)
 
-        response = requests.post(
+        response = self.session.post(
             url,
-            json=request_data,
+            data=orjson.dumps(request_data),
             headers=self.headers,
             params={"token": self.token},
             timeout=30,
         )
         response.raise_for_status()
-        job_id = response.json()["data"]["id"]
+        job_id = orjson.loads(response.content)["data"]["id"]
         logging.info(f"Started reviews scrape job with ID: {job_id}")
         return job_id
 
@@ -128,43 +313,92 @@ class ApifyService:
 class LinkVerificationService:
     """Service to verify Instagram and Facebook links."""
 
-    def __init__(self) -> None:
+    CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+    def __init__(self, cache_path: str | None = ".verify_cache.sqlite") -> None:
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        self.session = _build_session()
+
+        # Remember results between runs so unchanged links aren't re-checked
+        self._cache: sqlite3.Connection | None = None
+        self._cache_lock = threading.Lock()
+        if cache_path:
+            self._cache = sqlite3.connect(cache_path, check_same_thread=False)
+            self._cache.execute(
+                "CREATE TABLE IF NOT EXISTS link_check ("
+                "platform TEXT NOT NULL, url TEXT NOT NULL, valid INTEGER NOT NULL, "
+                "ts INTEGER NOT NULL, PRIMARY KEY (platform, url))"
+            )
+            self._cache.commit()
+
+    def _get_cached(self, platform: str, url: str) -> bool | None:
+        """Return a cached result that is still within the TTL, if any."""
+        if self._cache is None:
+            return None
+        with self._cache_lock:
+            row = self._cache.execute(
+                "SELECT valid, ts FROM link_check WHERE platform = ? AND url = ?",
+                (platform, url),
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.CACHE_TTL_SECONDS:
+            return None
+        return bool(row[0])
+
+    def _remember(self, platform: str, url: str, is_valid: bool) -> bool:
+        """Store a verification result in the cache and return it."""
+        if self._cache is not None:
+            with self._cache_lock:
+                self._cache.execute(
+                    "INSERT OR REPLACE INTO link_check (platform, url, valid, ts) "
+                    "VALUES (?, ?, ?, ?)",
+                    (platform, url, int(is_valid), int(time.time())),
+                )
+                self._cache.commit()
+        return is_valid
 
     def verify_instagram(self, url: str) -> bool:
         """Verify if an Instagram link is valid."""
         if not url or not url.strip():
             return False
 
+        cached = self._get_cached("instagram", url)
+        if cached is not None:
+            logging.info("Using cached Instagram result for: %s", url)
+            return cached
+
         try:
-            logging.info(f"Verifying Instagram link: {url}")
-            response = requests.head(
-                url, headers=self.headers, timeout=10, allow_redirects=True
-            )
+            logging.info("Verifying Instagram link: %s", url)
+            with _host_semaphore(url):
+                response = self.session.head(
+                    url, headers=self.headers, timeout=10, allow_redirects=True
+                )
 
             # Check if it's a valid response (not 404, 403, etc.)
             if response.status_code >= 400:
                 logging.warning(
-                    f"Instagram link returned {response.status_code}: {url}"
+                    "Instagram link returned %d: %s", response.status_code, url
                 )
-                return False
+                # Rate limits and server errors are transient, so don't cache them
+                if response.status_code == 429 or response.status_code >= 500:
+                    return False
+                return self._remember("instagram", url, False)
 
             # Check if it redirected to login or homepage (common for invalid profiles)
             final_url = response.url.lower()
             if "accounts/login" in final_url or final_url.endswith("instagram.com/"):
-                logging.warning(f"Instagram link redirected to login/homepage: {url}")
-                return False
+                logging.warning("Instagram link redirected to login/homepage: %s", url)
+                return self._remember("instagram", url, False)
 
-            logging.info(f"Instagram link is valid: {url}")
-            return True
+            logging.info("Instagram link is valid: %s", url)
+            return self._remember("instagram", url, True)
 
         except requests.exceptions.Timeout:
-            logging.warning(f"Instagram link timed out: {url}")
+            logging.warning("Instagram link timed out: %s", url)
             return False
         except requests.exceptions.RequestException as e:
-            logging.warning(f"Error verifying Instagram link {url}: {e}")
+            logging.warning("Error verifying Instagram link %s: %s", url, e)
             return False
 
     def verify_facebook(self, url: str) -> bool:
@@ -172,64 +406,139 @@ class LinkVerificationService:
         if not url or not url.strip():
             return False
 
+        cached = self._get_cached("facebook", url)
+        if cached is not None:
+            logging.info("Using cached Facebook result for: %s", url)
+            return cached
+
         try:
-            logging.info(f"Verifying Facebook link: {url}")
-            response = requests.head(
-                url, headers=self.headers, timeout=10, allow_redirects=True
-            )
+            logging.info("Verifying Facebook link: %s", url)
+            with _host_semaphore(url):
+                response = self.session.head(
+                    url, headers=self.headers, timeout=10, allow_redirects=True
+                )
 
             # Check if it's a valid response
             if response.status_code >= 400:
-                logging.warning(f"Facebook link returned {response.status_code}: {url}")
-                return False
+                logging.warning(
+                    "Facebook link returned %d: %s", response.status_code, url
+                )
+                # Rate limits and server errors are transient, so don't cache them
+                if response.status_code == 429 or response.status_code >= 500:
+                    return False
+                return self._remember("facebook", url, False)
 
             # Check if it redirected to login or homepage
             final_url = response.url.lower()
             if "login" in final_url or final_url.endswith("facebook.com/"):
-                logging.warning(f"Facebook link redirected to login/homepage: {url}")
-                return False
+                logging.warning("Facebook link redirected to login/homepage: %s", url)
+                return self._remember("facebook", url, False)
 
-            logging.info(f"Facebook link is valid: {url}")
-            return True
+            logging.info("Facebook link is valid: %s", url)
+            return self._remember("facebook", url, True)
 
         except requests.exceptions.Timeout:
-            logging.warning(f"Facebook link timed out: {url}")
+            logging.warning("Facebook link timed out: %s", url)
             return False
         except requests.exceptions.RequestException as e:
-            logging.warning(f"Error verifying Facebook link {url}: {e}")
+            logging.warning("Error verifying Facebook link %s: %s", url, e)
             return False
 
 
+# MX lookup results by domain, shared by the sync and async validation paths
+_mx_results: dict[str, bool] = {}
+
+
+def _mx_found(domain: str, outcome: dns.resolver.Answer | Exception) -> bool:
+    """Turn an MX lookup answer or the exception it raised into a result."""
+    if isinstance(
+        outcome, (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout)
+    ):
+        logging.debug("No MX records found for domain: %s", domain)
+        return False
+    if isinstance(outcome, Exception):
+        logging.debug("Error validating domain %s: %s", domain, outcome)
+        return False
+    return len(outcome) > 0
+
+
 class EmailValidationService:
     """Service to validate email addresses."""
 
-    def __init__(self) -> None:
-        self.email_pattern = re.compile(
-            r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Z|a-z]{2,}$"
-        )
+    EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[A-Za-z]{2,}$")
+
+    def __init__(self, use_regex: bool = False) -> None:
+        # The regex check is kept for compatibility with older results
+        self.use_regex = use_regex
 
     def validate_format(self, email: str) -> bool:
         """Check if email has valid format."""
         if not email or not email.strip():
             return False
-        return bool(self.email_pattern.match(email.strip()))
+        if self.use_regex:
+            return bool(self.EMAIL_PATTERN.match(email.strip()))
+        try:
+            validate_email_syntax(email.strip(), check_deliverability=False)
+        except EmailNotValidError:
+            return False
+        return True
 
     def validate_domain(self, email: str) -> bool:
         """Check if email domain has valid MX records."""
         if not self.validate_format(email):
             return False
 
-        try:
-            domain = email.split("@")[1]
-            # Check if domain has MX records
-            mx_records = dns.resolver.resolve(domain, "MX")
-            return len(list(mx_records)) > 0
-        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer, dns.resolver.Timeout):
-            logging.debug(f"No MX records found for domain: {domain}")
-            return False
-        except Exception as e:
-            logging.debug(f"Error validating domain for {email}: {e}")
-            return False
+        domain = self.get_domain(email)
+        if domain not in _mx_results:
+            try:
+                answer = dns.resolver.resolve(domain, "MX")
+            except Exception as e:
+                _mx_results[domain] = _mx_found(domain, e)
+            else:
+                _mx_results[domain] = _mx_found(domain, answer)
+        return _mx_results[domain]
+
+    def get_domain(self, email: str) -> str:
+        """Return the lowercased domain part of an email address."""
+        return email.strip().rsplit("@", 1)[1].lower()
+
+    async def _has_mx_records_async(
+        self,
+        resolver: dns.asyncresolver.Resolver,
+        domain: str,
+        semaphore: asyncio.Semaphore,
+    ) -> bool:
+        async with semaphore:
+            try:
+                answer = await resolver.resolve(domain, "MX")
+            except Exception as e:
+                return _mx_found(domain, e)
+        return _mx_found(domain, answer)
+
+    async def _check_domains_async(
+        self, domains: list[str], max_in_flight: int
+    ) -> dict[str, bool]:
+        resolver = dns.asyncresolver.Resolver(configure=True)
+        resolver.lifetime = 5
+        semaphore = asyncio.Semaphore(max_in_flight)
+        results = await asyncio.gather(
+            *(
+                self._has_mx_records_async(resolver, domain, semaphore)
+                for domain in domains
+            )
+        )
+        return dict(zip(domains, results))
+
+    def validate_domains(
+        self, domains: set[str], max_in_flight: int = 256
+    ) -> dict[str, bool]:
+        """Check MX records for many domains concurrently."""
+        pending = sorted(domain for domain in domains if domain not in _mx_results)
+        if pending:
+            _mx_results.update(
+                asyncio.run(self._check_domains_async(pending, max_in_flight))
+            )
+        return {domain: _mx_results[domain] for domain in domains}
 
     def validate_email(self, email: str, check_domain: bool = True) -> bool:
         """Validate email format and optionally check domain."""
@@ -241,6 +550,12 @@ class EmailValidationService:
 
 
 class WebsiteScraperService:
+    # Contact details are usually near the top or in the footer, so cap the read
+    MAX_CONTENT_BYTES = 512 * 1024
+
+    def __init__(self) -> None:
+        self.session = _build_session()
+
     def scrape_website(self, url: str) -> dict[str, str | None]:
         """Scrape a website and extract email and social media links using regex."""
         result: dict[str, str | None] = {
@@ -250,53 +565,38 @@ class WebsiteScraperService:
             "linkedin": None,
         }
 
+        if not url or not url.strip():
+            return result
+
         try:
-            logging.info(f"Scraping website: {url}")
+            logging.info("Scraping website: %s", url)
 
             # Add http:// if no scheme is present
             if not url.startswith(("http://", "https://")):
                 url = "https://" + url
 
-            # Fetch website content
-            response = requests.get(
-                url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10
-            )
-            response.raise_for_status()
-            content = response.text
-
-            # Extract email using regex
-            email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-            emails = re.findall(email_pattern, content)
-            if emails:
-                result["email"] = emails[0]
-                logging.info(f"Found email: {emails[0]}")
-
-            # Extract social media links
-            instagram_pattern = (
-                r"(?:https?://)?(?:www\.)?instagram\.com/([a-zA-Z0-9._]+)"
-            )
-            facebook_pattern = r"(?:https?://)?(?:www\.)?facebook\.com/([a-zA-Z0-9._]+)"
-            linkedin_pattern = r"(?:https?://)?(?:www\.)?linkedin\.com/(?:company|in)/([a-zA-Z0-9._-]+)"
-
-            instagram_matches = re.findall(instagram_pattern, content)
-            if instagram_matches:
-                result["instagram"] = f"https://instagram.com/{instagram_matches[0]}"
-                logging.info(f"Found Instagram: {result['instagram']}")
-
-            facebook_matches = re.findall(facebook_pattern, content)
-            if facebook_matches:
-                result["facebook"] = f"https://facebook.com/{facebook_matches[0]}"
-                logging.info(f"Found Facebook: {result['facebook']}")
-
-            linkedin_matches = re.findall(linkedin_pattern, content)
-            if linkedin_matches:
-                result["linkedin"] = (
-                    f"https://linkedin.com/company/{linkedin_matches[0]}"
-                )
-                logging.info(f"Found LinkedIn: {result['linkedin']}")
+            # Fetch website content, reading at most MAX_CONTENT_BYTES
+            with _host_semaphore(url):
+                with self.session.get(
+                    url, headers={"User-Agent": "Mozilla/5.0"}, timeout=10, stream=True
+                ) as response:
+                    response.raise_for_status()
+                    raw = response.raw.read(
+                        self.MAX_CONTENT_BYTES, decode_content=True
+                    )
+                    content = raw.decode(
+                        response.encoding or "utf-8", errors="replace"
+                    )
+
+            result = _extract_contacts(content)
+            for kind, value in result.items():
+                if value is not None:
+                    template, label = _CONTACT_FORMATS[kind]
+                    result[kind] = template.format(value)
+                    logging.info("Found %s: %s", label, result[kind])
 
         except Exception as e:
-            logging.error(f"Error scraping {url}: {e}")
+            logging.error("Error scraping %s: %s", url, e)
 
         return result
 
@@ -322,8 +622,9 @@ class GoogleSheetsService:
         self.sheet_id = sheet_id
         self.sheet_name = sheet_name
         self.creds_file = creds_file
+        self._spreadsheet_cache: gspread.Spreadsheet | None = None
+        self._headers: list[str] | None = None
         self.worksheet = self._get_worksheet()
-        self._spreadsheet_cache = None
 
     def _get_spreadsheet(self) -> gspread.Spreadsheet:
         """Get the spreadsheet object, with caching."""
@@ -347,57 +648,66 @@ class GoogleSheetsService:
                 title=self.sheet_name, rows=1, cols=len(self.EXPECTED_HEADERS)
             )
             worksheet.append_row(self.EXPECTED_HEADERS)
+            self._headers = list(self.EXPECTED_HEADERS)
             return worksheet
 
+    def _get_headers(self) -> list[str]:
+        """Get the header row, with caching, adding defaults if it is missing."""
+        if self._headers is None:
+            headers = self.worksheet.row_values(1)
+            if not headers:
+                logging.info("No headers found. Adding headers.")
+                headers = list(self.EXPECTED_HEADERS)
+                self.worksheet.append_row(headers)
+            self._headers = headers
+        return self._headers
+
     def read_leads(self) -> list[ExistingLead]:
         """Read all leads from the Google Sheet."""
         logging.info("Reading existing leads from Google Sheet.")
         try:
-            all_values = self.worksheet.get_all_values()
-
-            if not all_values:
-                logging.info("No existing leads found.")
-                return []
-
-            headers = all_values[0]
-            leads = []
-            for row in all_values[1:]:
-                lead_dict = {
-                    headers[i]: row[i] if i < len(row) else None
-                    for i in range(len(headers))
-                }
-                leads.append(ExistingLead(**lead_dict))
-
-            logging.info(f"Found {len(leads)} existing leads.")
-            return leads
+            return self._parse_leads(self.worksheet.get_all_values())
         except Exception as e:
             logging.error(f"Error reading leads from sheet: {e}")
             return []
 
+    def _parse_leads(self, all_values: list[list[str]]) -> list[ExistingLead]:
+        """Build leads from raw sheet values, including the header row."""
+        if not all_values:
+            logging.info("No existing leads found.")
+            return []
+
+        headers = all_values[0]
+        # Look up the column positions once rather than building a dict per row
+        business_col = headers.index("Business") if "Business" in headers else None
+        phone_col = headers.index("Phone") if "Phone" in headers else None
+
+        leads = []
+        for row in all_values[1:]:
+            leads.append(
+                ExistingLead(
+                    Business=(
+                        row[business_col]
+                        if business_col is not None and business_col < len(row)
+                        else None
+                    ),
+                    Phone=(
+                        row[phone_col]
+                        if phone_col is not None and phone_col < len(row)
+                        else None
+                    ),
+                )
+            )
+
+        logging.info(f"Found {len(leads)} existing leads.")
+        return leads
+
     def append_leads(self, leads: list[dict[str, str]]) -> None:
         if not leads:
             logging.info("No new leads to append.")
             return
 
-        all_values = self.worksheet.get_all_values()
-        headers: list[str]
-        if not all_values or not all_values[0]:
-            logging.info("No headers found. Adding headers.")
-            headers = [
-                "ID",
-                "Business",
-                "Website",
-                "Owner",
-                "Email",
-                "Phone",
-                "Instagram",
-                "Facebook",
-                "Linkedin",
-                "Address",
-            ]
-            self.worksheet.append_row(headers)
-        else:
-            headers = all_values[0]
+        headers = self._get_headers()
 
         logging.info(f"Appending {len(leads)} new leads to the sheet.")
 
@@ -440,7 +750,6 @@ class GoogleSheetsService:
             logging.info("Sheet is empty or only has headers. Nothing to dedupe.")
             return
 
-        headers = all_values[0]
         data_rows = all_values[1:]
         original_count = len(data_rows)
 
@@ -448,10 +757,10 @@ class GoogleSheetsService:
 
         # Track seen values in the first column
         seen_names: set[str] = set()
-        unique_rows = [headers]  # Start with headers
+        # 1-based sheet row numbers of the duplicates (row 1 is the header)
+        duplicate_rows: list[int] = []
 
-        duplicates_removed = 0
-        for row in data_rows:
+        for row_number, row in enumerate(data_rows, start=2):
             # Get the first column value (Name)
             if not row:  # Skip completely empty rows
                 continue
@@ -461,27 +770,38 @@ class GoogleSheetsService:
             # Keep row if first column is empty or hasn't been seen before
             if not first_col_value:
                 logging.debug("Found row with empty first column, keeping it.")
-                unique_rows.append(row)
             elif first_col_value not in seen_names:
                 seen_names.add(first_col_value)
-                unique_rows.append(row)
             else:
-                duplicates_removed += 1
-                logging.debug(f"Removing duplicate: {row[0]}")
+                duplicate_rows.append(row_number)
+                logging.debug("Removing duplicate: %s", row[0])
 
+        duplicates_removed = len(duplicate_rows)
         if duplicates_removed == 0:
             logging.info("No duplicates found!")
             return
 
         logging.info(f"Removing {duplicates_removed} duplicate rows...")
 
-        # Clear the sheet and write back the unique rows
-        self.worksheet.clear()
-        self.worksheet.update(unique_rows, value_input_option="USER_ENTERED")
+        # Delete only the duplicate rows, bottom-up so earlier indices stay valid
+        delete_requests = [
+            {
+                "deleteDimension": {
+                    "range": {
+                        "sheetId": self.worksheet.id,
+                        "dimension": "ROWS",
+                        "startIndex": row_number - 1,
+                        "endIndex": row_number,
+                    }
+                }
+            }
+            for row_number in reversed(duplicate_rows)
+        ]
+        self.worksheet.spreadsheet.batch_update({"requests": delete_requests})
 
         logging.info(
             f"Deduplication complete! Removed {duplicates_removed} duplicates. "
-            f"Kept {len(unique_rows) - 1} unique rows."
+            f"Kept {original_count - duplicates_removed} unique rows."
         )
 
     def get_all_emails(self) -> list[str]:
@@ -552,7 +872,9 @@ class GoogleSheetsService:
         logging.info(f"Found {len(place_ids)} place IDs in the sheet.")
         return place_ids
 
-    def verify_and_clean_links(self, verifier: "LinkVerificationService") -> None:
+    def verify_and_clean_links(
+        self, verifier: "LinkVerificationService", max_workers: int = 64
+    ) -> None:
         """Verify Instagram and Facebook links and clear invalid ones."""
         logging.info("Reading all rows from the sheet for verification...")
         all_values = self.worksheet.get_all_values()
@@ -579,40 +901,49 @@ class GoogleSheetsService:
 
         logging.info(f"Found {len(data_rows)} rows to verify.")
 
+        # Collect every link to check as (row index, column, url)
+        tasks: list[tuple[int, int, str]] = []
+        for row_idx, row in enumerate(data_rows):
+            for col in (instagram_col, facebook_col):
+                if col is not None and col < len(row):
+                    url = row[col].strip()
+                    if url:
+                        tasks.append((row_idx, col, url))
+
+        def check(task: tuple[int, int, str]) -> bool:
+            _, col, url = task
+            if col == instagram_col:
+                return verifier.verify_instagram(url)
+            return verifier.verify_facebook(url)
+
+        # Links are checked concurrently; each HEAD request is network-bound
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(check, tasks))
+
         instagram_cleaned = 0
         facebook_cleaned = 0
-        updated_rows = [headers]
-
-        for row_idx, row in enumerate(data_rows, start=1):
-            # Ensure row has enough columns
-            while len(row) < len(headers):
-                row.append("")
-
-            row_modified = False
-
-            # Verify Instagram if present
-            if instagram_col is not None and instagram_col < len(row):
-                instagram_url = row[instagram_col].strip()
-                if instagram_url and not verifier.verify_instagram(instagram_url):
-                    logging.info(
-                        f"Row {row_idx}: Clearing invalid Instagram link: {instagram_url}"
-                    )
-                    row[instagram_col] = ""
-                    instagram_cleaned += 1
-                    row_modified = True
-
-            # Verify Facebook if present
-            if facebook_col is not None and facebook_col < len(row):
-                facebook_url = row[facebook_col].strip()
-                if facebook_url and not verifier.verify_facebook(facebook_url):
-                    logging.info(
-                        f"Row {row_idx}: Clearing invalid Facebook link: {facebook_url}"
-                    )
-                    row[facebook_col] = ""
-                    facebook_cleaned += 1
-                    row_modified = True
+        updates: list[dict[str, Any]] = []
 
-            updated_rows.append(row)
+        for (row_idx, col, url), is_valid in zip(tasks, results):
+            if is_valid:
+                continue
+            if col == instagram_col:
+                logging.info(
+                    "Row %d: Clearing invalid Instagram link: %s", row_idx + 1, url
+                )
+                instagram_cleaned += 1
+            else:
+                logging.info(
+                    "Row %d: Clearing invalid Facebook link: %s", row_idx + 1, url
+                )
+                facebook_cleaned += 1
+            # Data rows start at sheet row 2, below the header
+            updates.append(
+                {
+                    "range": rowcol_to_a1(row_idx + 2, col + 1),
+                    "values": [[""]],
+                }
+            )
 
         total_cleaned = instagram_cleaned + facebook_cleaned
         if total_cleaned == 0:
@@ -623,9 +954,8 @@ class GoogleSheetsService:
         logging.info(f"Instagram links cleaned: {instagram_cleaned}")
         logging.info(f"Facebook links cleaned: {facebook_cleaned}")
 
-        # Update the entire sheet with cleaned data
-        self.worksheet.clear()
-        self.worksheet.update(updated_rows, value_input_option="USER_ENTERED")
+        # Clear only the invalid cells
+        self.worksheet.batch_update(updates, value_input_option="USER_ENTERED")
 
         logging.info(f"Verification complete! Cleaned {total_cleaned} invalid links.")
 
@@ -642,16 +972,24 @@ class GoogleSheetsService:
         """
         logging.info(f"Importing leads from outreach sheet: {source_sheet_name}")
 
+        # Read the source sheet and the existing leads in one batchGet call
         try:
-            # Get the source worksheet
             spreadsheet = self._get_spreadsheet()
-            source_worksheet = spreadsheet.worksheet(source_sheet_name)
-        except gspread.WorksheetNotFound:
-            logging.error(f"Source worksheet '{source_sheet_name}' not found!")
-            return
+            value_ranges = spreadsheet.values_batch_get(
+                [
+                    absolute_range_name(source_sheet_name),
+                    absolute_range_name(self.sheet_name),
+                ]
+            )["valueRanges"]
+        except gspread.exceptions.APIError as e:
+            # A missing sheet shows up as an unparseable range; anything else
+            # (quota, permissions, server errors) should fail loudly
+            if e.code == 400 and "Unable to parse range" in str(e):
+                logging.error(f"Source worksheet '{source_sheet_name}' not found!")
+                return
+            raise
 
-        # Read all values from source sheet
-        all_values = source_worksheet.get_all_values()
+        all_values = value_ranges[0].get("values", [])
 
         if not all_values or len(all_values) <= 1:
             logging.info("Source sheet is empty or only has headers.")
@@ -681,15 +1019,15 @@ class GoogleSheetsService:
         logging.info(f"Found columns - Business: {business_col}, Owner: {owner_col}, "
                     f"Phone: {phone_col}, City: {city_col}, Website: {website_col}")
 
-        # Read existing leads to avoid duplicates
-        existing_leads = self.read_leads()
+        # Existing leads are used to avoid duplicates
+        existing_leads = self._parse_leads(value_ranges[1].get("values", []))
         existing_phones = {
-            lead.Phone.replace("+", "").replace(" ", "").strip()
+            lead.Phone.translate(_PHONE_TRANS).strip()
             for lead in existing_leads
             if lead.Phone is not None and lead.Phone.strip()
         }
         existing_names = {
-            lead.Business.strip().lower()
+            lead.Business.strip().casefold()
             for lead in existing_leads
             if lead.Business is not None and lead.Business.strip()
         }
@@ -711,22 +1049,26 @@ class GoogleSheetsService:
 
             # Skip if no business name or phone
             if not business or not phone:
-                logging.debug(f"Row {row_idx}: Skipping - missing business name or phone")
+                logging.debug(
+                    "Row %d: Skipping - missing business name or phone", row_idx
+                )
                 skipped_count += 1
                 continue
 
             # Clean phone number
-            clean_phone = phone.replace("+", "").replace(" ", "").strip()
-            normalized_name = business.lower()
+            clean_phone = phone.translate(_PHONE_TRANS).strip()
+            normalized_name = business.casefold()
 
             # Check for duplicates
             if clean_phone in existing_phones:
-                logging.debug(f"Row {row_idx}: Skipping duplicate phone: {phone}")
+                logging.debug("Row %d: Skipping duplicate phone: %s", row_idx, phone)
                 skipped_count += 1
                 continue
 
             if normalized_name in existing_names:
-                logging.debug(f"Row {row_idx}: Skipping duplicate business: {business}")
+                logging.debug(
+                    "Row %d: Skipping duplicate business: %s", row_idx, business
+                )
                 skipped_count += 1
                 continue
 
@@ -771,34 +1113,33 @@ class LeadScraperWorkflow:
         )
 
     def _clean_phone(self, phone: str) -> str:
-        return phone.replace("+", "").replace(" ", "")
+        return phone.translate(_PHONE_TRANS)
 
     def _filter_new_leads(
-        self, scraped: list[dict[str, Any]], existing: list[ExistingLead]
+        self, scraped: Iterable[dict[str, Any]], existing: list[ExistingLead]
     ) -> list[dict[str, str]]:
-        existing_phones = {
-            self._clean_phone(lead.Phone) for lead in existing if lead.Phone is not None
-        }
-
-        # Track existing names for deduplication
-        existing_lead_names = set()
+        # Track existing phones and names for deduplication in a single pass
+        existing_phones: set[str] = set()
+        existing_lead_names: set[str] = set()
         for lead in existing:
-            if lead.Business is not None:
-                existing_lead_names.add(lead.Business.strip().lower())
+            if lead.Phone is not None:
+                existing_phones.add(self._clean_phone(lead.Phone))
             # check if the lead name is not None and not empty
             if lead.Business is not None and lead.Business.strip():
-                pass
+                existing_lead_names.add(lead.Business.strip().casefold())
             else:
-                logging.warning(f"Skipping lead with no name: {lead}")
+                logging.warning("Skipping lead with no name: %s", lead)
 
         new_leads = []
+        scraped_count = 0
         for item in scraped:
+            scraped_count += 1
             phone = item.get("phone")
             title = item.get("title", "").strip()
 
             if phone and title:
                 clean_phone = self._clean_phone(phone)
-                normalized_name = title.lower()
+                normalized_name = title.casefold()
 
                 # Check if both phone and name are unique
                 if (
@@ -822,23 +1163,28 @@ class LeadScraperWorkflow:
                     existing_phones.add(clean_phone)
                     existing_lead_names.add(normalized_name)
                 elif normalized_name in existing_lead_names:
-                    logging.debug(f"Skipping duplicate name: {title}")
+                    logging.debug("Skipping duplicate name: %s", title)
                 elif clean_phone in existing_phones:
-                    logging.debug(f"Skipping duplicate phone: {clean_phone}")
+                    logging.debug("Skipping duplicate phone: %s", clean_phone)
 
         logging.info(
-            f"Found {len(scraped)} scraped leads, {len(new_leads)} of them are new."
+            f"Found {scraped_count} scraped leads, {len(new_leads)} of them are new."
         )
         return new_leads
 
     def _enrich_leads(self, leads: list[dict[str, str]]) -> list[dict[str, str]]:
         """Enrich leads by scraping their websites for email and social media links."""
+        if not leads:
+            return []
+
+        # Scrape websites concurrently; each request is network-bound
+        websites = [lead.get("website", "") for lead in leads]
+        with ThreadPoolExecutor(max_workers=self.config.enrich_workers) as executor:
+            results = list(executor.map(self.scraper.scrape_website, websites))
+
         enriched_leads = []
-        for lead in leads:
-            website = lead.get("website", "")
-            if website:
-                # Scrape for email and social media
-                scraped_data = self.scraper.scrape_website(website)
+        for lead, scraped_data in zip(leads, results):
+            if lead.get("website", ""):
                 lead["email"] = scraped_data.get("email") or ""
                 lead["instagram"] = scraped_data.get("instagram") or ""
                 lead["facebook"] = scraped_data.get("facebook") or ""
@@ -851,7 +1197,10 @@ class LeadScraperWorkflow:
     def _wait_for_completion(self, job_id: str) -> str:
         logging.info(f"Waiting for job {job_id} to complete...")
         while True:
-            status = self.apify.get_job_status(job_id)
+            # Long-poll so we return as soon as the run finishes
+            status = self.apify.get_job_status(
+                job_id, wait_for_finish=self.config.poll_interval
+            )
             if status.status == "SUCCEEDED":
                 logging.info(f"Job {job_id} succeeded.")
                 if status.defaultDatasetId is None:
@@ -859,8 +1208,11 @@ class LeadScraperWorkflow:
                     logging.error(msg)
                     raise ValueError(msg)
                 return status.defaultDatasetId
+            if status.status in ApifyService.TERMINAL_STATUSES:
+                msg = f"Job {job_id} finished with status {status.status}"
+                logging.error(msg)
+                raise ValueError(msg)
             logging.info(f"Job {job_id} status is {status.status}. Waiting...")
-            time.sleep(self.config.poll_interval)
 
     def run(self) -> None:
         logging.info("Starting lead scraper workflow.")
@@ -872,8 +1224,9 @@ class LeadScraperWorkflow:
 
         job_id = self.apify.start_scrape(request)
         dataset_id = self._wait_for_completion(job_id)
-        scraped_data = self.apify.get_dataset(dataset_id)
         existing_leads = self.sheets.read_leads()
+        # Items are streamed and filtered as they arrive
+        scraped_data = self.apify.iter_dataset(dataset_id)
         new_leads = self._filter_new_leads(scraped_data, existing_leads)
 
         # Enrich leads with website data
@@ -932,6 +1285,8 @@ def main() -> None:
         location=os.getenv("LOCATION", "Manchester, GB"),
         max_results=int(os.getenv("MAX_RESULTS", 120)),
         poll_interval=int(os.getenv("POLL_INTERVAL", 30)),
+        apify_cache_dir=os.getenv("APIFY_CACHE_DIR") or None,
+        enrich_workers=int(os.getenv("ENRICH_WORKERS", 32)),
     )
     logging.info("Configuration loaded.")
 
@@ -969,12 +1324,23 @@ def main() -> None:
         invalid_emails = []
 
         logging.info("Validating emails...")
+        well_formed = {
+            email for email in unique_emails if email_validator.validate_format(email)
+        }
+
+        # Resolve each domain once, concurrently, instead of once per email
+        domains = {email_validator.get_domain(email) for email in well_formed}
+        logging.info(f"Checking MX records for {len(domains)} unique domains...")
+        domain_results = email_validator.validate_domains(domains)
+
         for email in unique_emails:
-            if email_validator.validate_email(email, check_domain=True):
+            if email in well_formed and domain_results.get(
+                email_validator.get_domain(email), False
+            ):
                 valid_emails.append(email)
             else:
                 invalid_emails.append(email)
-                logging.debug(f"Invalid email: {email}")
+                logging.debug("Invalid email: %s", email)
 
         # Print results
         print("\n" + "=" * 60)
@@ -1009,29 +1375,37 @@ def main() -> None:
         logging.info(f"Using first place ID: {first_place_id}")
 
         # Initialize Apify service
-        apify_service = ApifyService(config.apify_token)
+        apify_service = ApifyService(
+            config.apify_token, cache_dir=config.apify_cache_dir
+        )
 
-        # Start reviews scrape job
-        job_id = apify_service.scrape_reviews(first_place_id, max_reviews=10)
+        # Reuse a cached dataset if one exists for this request
+        dataset = apify_service.load_cached_reviews(first_place_id, max_reviews=10)
 
-        # Wait for the job to complete
-        logging.info(f"Waiting for job {job_id} to complete...")
-        while True:
-            status = apify_service.get_job_status(job_id)
-            if status.status == "SUCCEEDED":
-                logging.info(f"Job {job_id} succeeded.")
-                if status.defaultDatasetId is None:
-                    logging.error("Job succeeded but no dataset ID found")
+        if dataset is None:
+            # Start reviews scrape job
+            job_id = apify_service.scrape_reviews(first_place_id, max_reviews=10)
+
+            # Wait for the job to complete
+            logging.info(f"Waiting for job {job_id} to complete...")
+            while True:
+                status = apify_service.get_job_status(
+                    job_id, wait_for_finish=config.poll_interval
+                )
+                if status.status == "SUCCEEDED":
+                    logging.info(f"Job {job_id} succeeded.")
+                    if status.defaultDatasetId is None:
+                        logging.error("Job succeeded but no dataset ID found")
+                        return
+                    break
+                elif status.status in ApifyService.TERMINAL_STATUSES:
+                    logging.error(f"Job {job_id} finished with status {status.status}.")
                     return
-                break
-            elif status.status == "FAILED":
-                logging.error(f"Job {job_id} failed.")
-                return
-            logging.info(f"Job {job_id} status is {status.status}. Waiting...")
-            time.sleep(config.poll_interval)
+                logging.info(f"Job {job_id} status is {status.status}. Waiting...")
 
-        # Get the dataset
-        dataset = apify_service.get_dataset(status.defaultDatasetId)
+            # Get the dataset
+            dataset = apify_service.get_dataset(status.defaultDatasetId)
+            apify_service.save_cached_reviews(first_place_id, dataset, max_reviews=10)
 
         if not dataset:
             logging.warning("No reviews found in the dataset.")
@@ -1055,7 +1429,7 @@ def main() -> None:
         print(f"Rating: {first_review.get('stars', 'N/A')} stars")
         print(f"Date: {first_review.get('publishedAtDate', 'N/A')}")
         print(f"\nReview Text:")
-        print(first_review.get('text', 'N/A'))
+        print(first_review.get("text") or first_review.get("reviewText") or "N/A")
         print("=" * 60)
 
         logging.info("Reviews mode finished.")
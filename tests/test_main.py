@@ -0,0 +1,52 @@
+import pytest
+
+from src.main import _extract_contacts
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (
+            "instagram.com/john.doe@gmail.com",
+            {
+                "email": "john.doe@gmail.com",
+                "instagram": "john.doe",
+                "facebook": None,
+                "linkedin": None,
+            },
+        ),
+        (
+            "mailto:x@facebook.com/foo",
+            {
+                "email": "x@facebook.com",
+                "instagram": None,
+                "facebook": "foo",
+                "linkedin": None,
+            },
+        ),
+        (
+            "https://www.instagram.com/facebook.com/shop and linkedin.com/in/shop",
+            {
+                "email": None,
+                "instagram": "facebook.com",
+                "facebook": "shop",
+                "linkedin": "shop",
+            },
+        ),
+    ],
+)
+def test_extract_contacts_finds_overlapping_matches(content, expected):
+    assert _extract_contacts(content) == expected
+
+
+def test_extract_contacts_keeps_first_match_of_each_kind():
+    content = (
+        "<a href='https://facebook.com/first'>a@one.com</a>"
+        "<a href='https://facebook.com/second'>b@two.com</a>"
+    )
+    assert _extract_contacts(content) == {
+        "email": "a@one.com",
+        "instagram": None,
+        "facebook": "first",
+        "linkedin": None,
+    }